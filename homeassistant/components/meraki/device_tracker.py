@@ -1,11 +1,16 @@
 """Support for the Meraki CMX location service."""
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Awaitable, Callable
+import hmac
 from http import HTTPStatus
 import json
 import logging
+import math
+from typing import Any
 
+import orjson
 import voluptuous as vol
 
 from homeassistant.components.device_tracker import (
@@ -13,7 +18,7 @@ from homeassistant.components.device_tracker import (
     SOURCE_TYPE_ROUTER,
 )
 from homeassistant.components.http import HomeAssistantView
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
@@ -22,7 +27,13 @@ CONF_SECRET = "secret"
 URL = "/api/meraki"
 VERSION = "2.0"
 VERSION2 = "2.1"
+MAX_BODY_SIZE = 4 * 1024 * 1024
 
+_VALID_VERSIONS = frozenset({VERSION, VERSION2})
+_VALID_TYPES = frozenset({"DevicesSeen", "BluetoothDevicesSeen"})
+
+_INVALID_COORDINATES = frozenset({"NaN", "nan"})
+_ATTR_KEYS = ("os", "manufacturer", "ipv4", "ipv6", "seenTime", "ssid")
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,6 +42,27 @@ PLATFORM_SCHEMA = PARENT_PLATFORM_SCHEMA.extend(
 )
 
 
+def _invalid_coordinate(value: Any) -> bool:
+    """Return True if a coordinate reported by Meraki is missing or NaN."""
+    if isinstance(value, str):
+        return value in _INVALID_COORDINATES
+    if isinstance(value, (int, float)):
+        return math.isnan(value)
+    return True
+
+
+def _parse_accuracy(value: Any) -> int:
+    """Return the uncertainty reported by Meraki as an integer, or 0 if invalid."""
+    if isinstance(value, str):
+        try:
+            value = float(value)
+        except ValueError:
+            return 0
+    if isinstance(value, (int, float)) and math.isfinite(value):
+        return int(value)
+    return 0
+
+
 async def async_setup_scanner(
     hass: HomeAssistant,
     config: ConfigType,
@@ -62,22 +94,42 @@ class MerakiView(HomeAssistantView):
 
     async def post(self, request):
         """Meraki CMX message received."""
+        if request.content_length and request.content_length > MAX_BODY_SIZE:
+            return self.json_message(
+                "Payload too large", HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+            )
+        body = await request.read()
+        if len(body) > MAX_BODY_SIZE:
+            return self.json_message(
+                "Payload too large", HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+            )
         try:
-            data = await request.json()
-        except ValueError:
-            return self.json_message("Invalid JSON", HTTPStatus.BAD_REQUEST)
-        _LOGGER.debug("Meraki Data from Post: %s", json.dumps(data))
+            data = orjson.loads(body)
+        except orjson.JSONDecodeError:
+            # orjson rejects the non-standard NaN/Infinity tokens that the
+            # stdlib parser accepts and Meraki may send for coordinates
+            try:
+                data = json.loads(body)
+            except ValueError:
+                return self.json_message("Invalid JSON", HTTPStatus.BAD_REQUEST)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Meraki Data from Post: %s", json.dumps(data))
         if not data.get("secret", False):
             _LOGGER.error("The secret is invalid")
             return self.json_message("No secret", HTTPStatus.UNPROCESSABLE_ENTITY)
-        if data["secret"] != self.secret:
+        if not isinstance(data["secret"], str) or not hmac.compare_digest(
+            data["secret"].encode(), self.secret.encode()
+        ):
             _LOGGER.error("Invalid Secret received from Meraki")
             return self.json_message("Invalid secret", HTTPStatus.UNPROCESSABLE_ENTITY)
-        if data["version"] != VERSION and data["version"] != VERSION2:
+        if (
+            not isinstance(data["version"], str)
+            or data["version"] not in _VALID_VERSIONS
+        ):
             _LOGGER.error("Invalid API version: %s", data["version"])
             return self.json_message("Invalid version", HTTPStatus.UNPROCESSABLE_ENTITY)
         _LOGGER.debug("Valid Secret")
-        if data["type"] not in ("DevicesSeen", "BluetoothDevicesSeen"):
+        if not isinstance(data["type"], str) or data["type"] not in _VALID_TYPES:
             _LOGGER.error("Unknown Device %s", data["type"])
             return self.json_message(
                 "Invalid device type", HTTPStatus.UNPROCESSABLE_ENTITY
@@ -85,53 +137,49 @@ class MerakiView(HomeAssistantView):
         _LOGGER.debug("Processing %s", data["type"])
         if not data["data"]["observations"]:
             _LOGGER.debug("No observations found")
-            return
-        self._handle(request.app["hass"], data)
-
-    @callback
-    def _handle(self, hass, data):
-        ap_mac = data["data"]["apMac"]
-        for i in data["data"]["observations"]:
-            data["data"]["secret"] = "hidden"
+            return self.json_message("OK")
+        await self._handle(data)
+        return self.json_message("OK")
+
+    async def _handle(self, data):
+        observations = data["data"]["observations"]
+        data["data"]["secret"] = "hidden"
+        ap_mac = data["data"].get("apMac")
+        base_attrs = {"ap_mac": ap_mac} if ap_mac else {}
+        async_see = self.async_see
+        coros = []
+        macs = []
+        for i in observations:
+            if (
+                not isinstance(i, dict)
+                or not isinstance(mac := i.get("clientMac"), str)
+                or not isinstance(loc := i.get("location"), dict)
+            ):
+                _LOGGER.warning("Skipping invalid observation: %s", i)
+                continue
+
+            lat = loc.get("lat")
+            lng = loc.get("lng")
+            accuracy = _parse_accuracy(loc.get("unc"))
 
-            lat = i["location"]["lat"]
-            lng = i["location"]["lng"]
-            try:
-                accuracy = int(float(i["location"]["unc"]))
-            except ValueError:
-                accuracy = 0
-
-            mac = i["clientMac"]
             _LOGGER.debug("clientMac: %s", mac)
 
-            if lat == "NaN" or lng == "NaN":
+            if _invalid_coordinate(lat) or _invalid_coordinate(lng):
                 _LOGGER.debug("No coordinates received, skipping location for: %s", mac)
                 gps_location = None
                 accuracy = None
             else:
                 gps_location = (lat, lng)
 
-            attrs = {}
             # Device name only provided if the device has a name within meraki dashboard
             # otherwise setting name to Device Mac Address
             device_name = i.get("name", str(mac))
-            if i.get("os", False):
-                attrs["os"] = i["os"]
-            if i.get("manufacturer", False):
-                attrs["manufacturer"] = i["manufacturer"]
-            if i.get("ipv4", False):
-                attrs["ipv4"] = i["ipv4"]
-            if i.get("ipv6", False):
-                attrs["ipv6"] = i["ipv6"]
-            if i.get("seenTime", False):
-                attrs["seenTime"] = i["seenTime"]
-            if i.get("ssid", False):
-                attrs["ssid"] = i["ssid"]
-            if ap_mac:
-                attrs["ap_mac"] = ap_mac
-
-            hass.async_create_task(
-                self.async_see(
+            attrs = {key: value for key in _ATTR_KEYS if (value := i.get(key))}
+            attrs.update(base_attrs)
+
+            macs.append(mac)
+            coros.append(
+                async_see(
                     gps=gps_location,
                     mac=mac,
                     dev_id=mac,
@@ -141,3 +189,8 @@ class MerakiView(HomeAssistantView):
                     attributes=attrs,
                 )
             )
+
+        results = await asyncio.gather(*coros, return_exceptions=True)
+        for mac, result in zip(macs, results):
+            if isinstance(result, Exception):
+                _LOGGER.error("Error updating Meraki client %s", mac, exc_info=result)
@@ -35,47 +35,53 @@ CONFIG_SCHEMA = cv.removed(DOMAIN, raise_if_present=False)
 _LOGGER = logging.getLogger(__name__)
 
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Set up Synology DSM sensors."""
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Migrate an old config entry."""
+    version = entry.version
 
-    # Migrate device indentifiers
-    dev_reg = dr.async_get(hass)
-    devices: list[dr.DeviceEntry] = dr.async_entries_for_config_entry(
-        dev_reg, entry.entry_id
-    )
-    for device in devices:
-        old_identifier = list(next(iter(device.identifiers)))
-        if len(old_identifier) > 2:
-            new_identifier = {
-                (old_identifier.pop(0), "_".join([str(x) for x in old_identifier]))
-            }
-            _LOGGER.debug(
-                "migrate identifier '%s' to '%s'", device.identifiers, new_identifier
+    _LOGGER.debug("Migrating from version %s", version)
+
+    # 1 -> 2: Migrate device identifiers and add missing verify_ssl
+    if version == 1:
+        if entry.data.get(CONF_VERIFY_SSL) is None:
+            hass.config_entries.async_update_entry(
+                entry, data={**entry.data, CONF_VERIFY_SSL: DEFAULT_VERIFY_SSL}
             )
-            dev_reg.async_update_device(device.id, new_identifiers=new_identifier)
 
-    # Migrate existing entry configuration
-    if entry.data.get(CONF_VERIFY_SSL) is None:
-        hass.config_entries.async_update_entry(
-            entry, data={**entry.data, CONF_VERIFY_SSL: DEFAULT_VERIFY_SSL}
+        dev_reg = dr.async_get(hass)
+        devices: list[dr.DeviceEntry] = dr.async_entries_for_config_entry(
+            dev_reg, entry.entry_id
         )
+        for device in devices:
+            old_identifier = next(iter(device.identifiers))
+            if len(old_identifier) > 2:
+                new_identifier = {
+                    (old_identifier[0], "_".join(map(str, old_identifier[1:])))
+                }
+                _LOGGER.debug(
+                    "migrate identifier '%s' to '%s'",
+                    device.identifiers,
+                    new_identifier,
+                )
+                dev_reg.async_update_device(device.id, new_identifiers=new_identifier)
+
+        version = entry.version = 2
+
+    _LOGGER.info("Migration to version %s successful", version)
+
+    return True
+
+
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Set up Synology DSM sensors."""
 
-    # Continue setup
     api = SynoApi(hass, entry)
     try:
         await api.async_setup()
     except SYNOLOGY_AUTH_FAILED_EXCEPTIONS as err:
-        if err.args[0] and isinstance(err.args[0], dict):
-            details = err.args[0].get(EXCEPTION_DETAILS, EXCEPTION_UNKNOWN)
-        else:
-            details = EXCEPTION_UNKNOWN
-        raise ConfigEntryAuthFailed(f"reason: {details}") from err
+        raise ConfigEntryAuthFailed(f"reason: {_exception_details(err)}") from err
     except SYNOLOGY_CONNECTION_EXCEPTIONS as err:
-        if err.args[0] and isinstance(err.args[0], dict):
-            details = err.args[0].get(EXCEPTION_DETAILS, EXCEPTION_UNKNOWN)
-        else:
-            details = EXCEPTION_UNKNOWN
-        raise ConfigEntryNotReady(details) from err
+        raise ConfigEntryNotReady(_exception_details(err)) from err
 
     # Services
     await async_setup_services(hass)
@@ -125,6 +131,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+def _exception_details(err: Exception) -> str:
+    """Return the details of a Synology DSM exception."""
+    if err.args and isinstance(details := err.args[0], dict):
+        return details.get(EXCEPTION_DETAILS, EXCEPTION_UNKNOWN)
+    return EXCEPTION_UNKNOWN
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload Synology DSM sensors."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
@@ -107,7 +107,7 @@ def _is_valid_ip(text: str) -> bool:
 class SynologyDSMFlowHandler(ConfigFlow, domain=DOMAIN):
     """Handle a config flow."""
 
-    VERSION = 1
+    VERSION = 2
 
     @staticmethod
     @callback
@@ -1,6 +1,7 @@
 """The tests the for Meraki device tracker."""
 from http import HTTPStatus
 import json
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -9,8 +10,10 @@ from homeassistant.components.meraki.device_tracker import (
     CONF_SECRET,
     CONF_VALIDATOR,
     URL,
+    MerakiView,
 )
 from homeassistant.const import CONF_PLATFORM
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.setup import async_setup_component
 
 
@@ -57,6 +60,12 @@ async def test_invalid_or_missing_data(mock_device_tracker_conf, meraki_client):
     assert req.status == HTTPStatus.UNPROCESSABLE_ENTITY
     assert text["message"] == "Invalid version"
 
+    data = {"version": [], "secret": "secret"}
+    req = await meraki_client.post(URL, data=json.dumps(data))
+    text = await req.json()
+    assert req.status == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert text["message"] == "Invalid version"
+
     data = {"version": "2.0", "secret": "invalid"}
     req = await meraki_client.post(URL, data=json.dumps(data))
     text = await req.json()
@@ -69,6 +78,12 @@ async def test_invalid_or_missing_data(mock_device_tracker_conf, meraki_client):
     assert req.status == HTTPStatus.UNPROCESSABLE_ENTITY
     assert text["message"] == "Invalid device type"
 
+    data = {"version": "2.0", "secret": "secret", "type": {}}
+    req = await meraki_client.post(URL, data=json.dumps(data))
+    text = await req.json()
+    assert req.status == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert text["message"] == "Invalid device type"
+
     data = {
         "version": "2.0",
         "secret": "secret",
@@ -76,7 +91,28 @@ async def test_invalid_or_missing_data(mock_device_tracker_conf, meraki_client):
         "data": {"observations": []},
     }
     req = await meraki_client.post(URL, data=json.dumps(data))
+    text = await req.json()
     assert req.status == HTTPStatus.OK
+    assert text["message"] == "OK"
+
+
+@patch("homeassistant.components.meraki.device_tracker.MAX_BODY_SIZE", 16)
+async def test_payload_too_large(mock_device_tracker_conf, meraki_client):
+    """Test oversized payloads are rejected before parsing."""
+    req = await meraki_client.post(URL, data=b" " * 17)
+    text = await req.json()
+    assert req.status == HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+    assert text["message"] == "Payload too large"
+
+    async def chunked_body():
+        """Yield a body without a Content-Length header."""
+        for _ in range(3):
+            yield b" " * 8
+
+    req = await meraki_client.post(URL, data=chunked_body())
+    text = await req.json()
+    assert req.status == HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+    assert text["message"] == "Payload too large"
 
 
 async def test_data_will_be_saved(mock_device_tracker_conf, hass, meraki_client):
@@ -132,3 +168,91 @@ async def test_data_will_be_saved(mock_device_tracker_conf, hass, meraki_client)
         "{}.{}".format("device_tracker", "00_26_ab_b8_a9_a5")
     ).state
     assert state_name == "home"
+
+
+async def test_invalid_observations(mock_device_tracker_conf, hass, meraki_client):
+    """Test observations without usable coordinates or a client MAC."""
+    data = {
+        "version": "2.0",
+        "secret": "secret",
+        "type": "DevicesSeen",
+        "data": {
+            "apMac": "00:18:0a:00:00:00",
+            "observations": [
+                {
+                    "location": {"lat": "NaN", "lng": "NaN", "unc": "NaN"},
+                    "clientMac": "00:26:ab:b8:a9:a6",
+                },
+                {
+                    "location": {"lat": None, "lng": None, "unc": None},
+                    "clientMac": "00:26:ab:b8:a9:a7",
+                },
+                {
+                    "location": {"lat": "51.5355157", "lng": "21.0699035"},
+                },
+                {
+                    "location": "invalid",
+                    "clientMac": "00:26:ab:b8:a9:a9",
+                },
+            ],
+        },
+    }
+    req = await meraki_client.post(URL, data=json.dumps(data))
+    assert req.status == HTTPStatus.OK
+    await hass.async_block_till_done()
+
+    for dev_id in ("00_26_ab_b8_a9_a6", "00_26_ab_b8_a9_a7"):
+        state = hass.states.get(f"device_tracker.{dev_id}")
+        assert state.state == "home"
+        assert "latitude" not in state.attributes
+        assert state.attributes["ap_mac"] == "00:18:0a:00:00:00"
+
+    assert len(hass.states.async_entity_ids("device_tracker")) == 2
+
+
+async def test_nan_tokens(mock_device_tracker_conf, hass, meraki_client):
+    """Test payloads with bare NaN tokens are still accepted."""
+    body = (
+        b'{"version": "2.0", "secret": "secret", "type": "DevicesSeen",'
+        b' "data": {"apMac": "00:18:0a:00:00:00", "observations": [{'
+        b'"location": {"lat": NaN, "lng": NaN, "unc": NaN},'
+        b' "clientMac": "00:26:ab:b8:a9:a8"}]}}'
+    )
+    req = await meraki_client.post(URL, data=body)
+    assert req.status == HTTPStatus.OK
+    await hass.async_block_till_done()
+
+    state = hass.states.get("device_tracker.00_26_ab_b8_a9_a8")
+    assert state.state == "home"
+    assert "latitude" not in state.attributes
+
+
+async def test_failed_observation_is_isolated(hass, caplog):
+    """Test a failing observation does not fail the whole request."""
+    async_see = AsyncMock(side_effect=[HomeAssistantError("boom"), None])
+    view = MerakiView({CONF_VALIDATOR: "validator", CONF_SECRET: "secret"}, async_see)
+    data = {
+        "version": "2.0",
+        "secret": "secret",
+        "type": "DevicesSeen",
+        "data": {
+            "observations": [
+                {
+                    "location": {"lat": "51.5", "lng": "21.0", "unc": "5"},
+                    "clientMac": "00:26:ab:b8:a9:b0",
+                },
+                {
+                    "location": {"lat": "51.5", "lng": "21.0", "unc": "5"},
+                    "clientMac": "00:26:ab:b8:a9:b1",
+                },
+            ]
+        },
+    }
+    request = MagicMock(content_length=None)
+    request.read = AsyncMock(return_value=json.dumps(data).encode())
+
+    response = await view.post(request)
+
+    assert response.status == HTTPStatus.OK
+    assert async_see.call_count == 2
+    assert "Error updating Meraki client 00:26:ab:b8:a9:b0" in caplog.text
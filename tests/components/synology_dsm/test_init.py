@@ -1,11 +1,20 @@
 """Tests for the Synology DSM component."""
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import pytest
-from synology_dsm.exceptions import SynologyDSMLoginInvalidException
+from synology_dsm.api.surveillance_station import SynoSurveillanceStation
+from synology_dsm.exceptions import (
+    SynologyDSMLoginInvalidException,
+    SynologyDSMRequestException,
+)
 
 from homeassistant import data_entry_flow
-from homeassistant.components.synology_dsm.const import DOMAIN, SERVICES
+from homeassistant.components.synology_dsm.const import (
+    DEFAULT_VERIFY_SSL,
+    DOMAIN,
+    SERVICES,
+)
+from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import (
     CONF_HOST,
     CONF_MAC,
@@ -13,10 +22,12 @@ from homeassistant.const import (
     CONF_PORT,
     CONF_SSL,
     CONF_USERNAME,
+    CONF_VERIFY_SSL,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
 
-from .consts import HOST, MACS, PASSWORD, PORT, USE_SSL, USERNAME
+from .consts import HOST, MACS, PASSWORD, PORT, SERIAL, USE_SSL, USERNAME
 
 from tests.common import MockConfigEntry
 
@@ -68,3 +79,148 @@ async def test_reauth_triggered(hass: HomeAssistant):
         entry.add_to_hass(hass)
         assert not await hass.config_entries.async_setup(entry.entry_id)
         mock_async_step_reauth.assert_called_once()
+
+
+@pytest.mark.no_bypass_setup
+async def test_migrate_device_identifiers(hass: HomeAssistant):
+    """Test device identifiers are migrated once."""
+    with patch("homeassistant.components.synology_dsm.common.SynologyDSM"), patch(
+        "homeassistant.components.synology_dsm.PLATFORMS", return_value=[]
+    ):
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            version=1,
+            data={
+                CONF_HOST: HOST,
+                CONF_PORT: PORT,
+                CONF_SSL: USE_SSL,
+                CONF_USERNAME: USERNAME,
+                CONF_PASSWORD: PASSWORD,
+                CONF_MAC: MACS[0],
+            },
+        )
+        entry.add_to_hass(hass)
+        dev_reg = dr.async_get(hass)
+        device = dev_reg.async_get_or_create(
+            config_entry_id=entry.entry_id,
+            identifiers={(DOMAIN, SERIAL, "volume_1")},
+        )
+
+        assert await hass.config_entries.async_setup(entry.entry_id)
+
+        assert entry.version == 2
+        assert dev_reg.async_get(device.id).identifiers == {
+            (DOMAIN, f"{SERIAL}_volume_1")
+        }
+
+
+@pytest.mark.no_bypass_setup
+async def test_migrate_verify_ssl_when_setup_fails(hass: HomeAssistant):
+    """Test verify_ssl is added even if the NAS cannot be reached."""
+    with patch(
+        "homeassistant.components.synology_dsm.SynoApi.async_setup",
+        side_effect=SynologyDSMRequestException(OSError("arg")),
+    ):
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            version=1,
+            data={
+                CONF_HOST: HOST,
+                CONF_PORT: PORT,
+                CONF_SSL: USE_SSL,
+                CONF_USERNAME: USERNAME,
+                CONF_PASSWORD: PASSWORD,
+                CONF_MAC: MACS[0],
+            },
+        )
+        entry.add_to_hass(hass)
+        assert not await hass.config_entries.async_setup(entry.entry_id)
+
+        assert entry.state is ConfigEntryState.SETUP_RETRY
+        assert entry.version == 2
+        assert entry.data[CONF_VERIFY_SSL] == DEFAULT_VERIFY_SSL
+
+
+@pytest.mark.no_bypass_setup
+async def test_surveillance_station_coordinators(hass: HomeAssistant):
+    """Test camera and switch coordinators are refreshed one after another."""
+    camera_refresh = AsyncMock()
+    switch_refresh = AsyncMock()
+    switch_setup = AsyncMock()
+    manager = MagicMock()
+    manager.attach_mock(camera_refresh, "camera_refresh")
+    manager.attach_mock(switch_refresh, "switch_refresh")
+    manager.attach_mock(switch_setup, "switch_setup")
+    with patch(
+        "homeassistant.components.synology_dsm.common.SynologyDSM"
+    ) as mock_dsm, patch(
+        "homeassistant.components.synology_dsm.PLATFORMS", return_value=[]
+    ), patch(
+        "homeassistant.components.synology_dsm.SynologyDSMCameraUpdateCoordinator.async_config_entry_first_refresh",
+        new=camera_refresh,
+    ), patch(
+        "homeassistant.components.synology_dsm.SynologyDSMSwitchUpdateCoordinator.async_config_entry_first_refresh",
+        new=switch_refresh,
+    ), patch(
+        "homeassistant.components.synology_dsm.SynologyDSMSwitchUpdateCoordinator.async_setup",
+        new=switch_setup,
+    ):
+        mock_dsm.return_value.apis = {
+            SynoSurveillanceStation.CAMERA_API_KEY: {},
+            SynoSurveillanceStation.INFO_API_KEY: {},
+            SynoSurveillanceStation.HOME_MODE_API_KEY: {},
+        }
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            data={
+                CONF_HOST: HOST,
+                CONF_PORT: PORT,
+                CONF_SSL: USE_SSL,
+                CONF_USERNAME: USERNAME,
+                CONF_PASSWORD: PASSWORD,
+                CONF_MAC: MACS[0],
+            },
+        )
+        entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+
+    assert entry.state is ConfigEntryState.LOADED
+    assert manager.mock_calls == [
+        call.camera_refresh(),
+        call.switch_refresh(),
+        call.switch_setup(),
+    ]
+
+
+@pytest.mark.no_bypass_setup
+async def test_switch_coordinator_setup_failed(hass: HomeAssistant):
+    """Test a failing switch coordinator setup retries the entry."""
+    with patch(
+        "homeassistant.components.synology_dsm.common.SynologyDSM"
+    ) as mock_dsm, patch(
+        "homeassistant.components.synology_dsm.PLATFORMS", return_value=[]
+    ), patch(
+        "homeassistant.components.synology_dsm.SynologyDSMSwitchUpdateCoordinator.async_config_entry_first_refresh",
+    ), patch(
+        "homeassistant.components.synology_dsm.SynologyDSMSwitchUpdateCoordinator.async_setup",
+        side_effect=SynologyDSMRequestException(OSError("arg")),
+    ):
+        mock_dsm.return_value.apis = {
+            SynoSurveillanceStation.INFO_API_KEY: {},
+            SynoSurveillanceStation.HOME_MODE_API_KEY: {},
+        }
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            data={
+                CONF_HOST: HOST,
+                CONF_PORT: PORT,
+                CONF_SSL: USE_SSL,
+                CONF_USERNAME: USERNAME,
+                CONF_PASSWORD: PASSWORD,
+                CONF_MAC: MACS[0],
+            },
+        )
+        entry.add_to_hass(hass)
+        assert not await hass.config_entries.async_setup(entry.entry_id)
+
+    assert entry.state is ConfigEntryState.SETUP_RETRY